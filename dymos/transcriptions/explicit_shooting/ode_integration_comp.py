@@ -2,11 +2,35 @@ import numpy as np
 import openmdao.api as om
 from scipy.integrate import solve_ivp
 
+try:
+    from openmdao.core.total_jac import _TotalJacInfo
+except ImportError:
+    _TotalJacInfo = None
+
 from ...options import options as dymos_options
 
 from .ode_evaluation_group import ODEEvaluationGroup
 
 
+def _as_slice_if_contiguous(idxs):
+    """
+    Return a slice equivalent to the given indices if they are contiguous and increasing.
+
+    Parameters
+    ----------
+    idxs : np.ndarray
+        An array of integer indices.
+
+    Returns
+    -------
+    slice or np.ndarray
+        A slice if the indices are a contiguous, increasing range, otherwise the original indices.
+    """
+    if idxs.size > 0 and np.array_equal(idxs, np.arange(idxs[0], idxs[0] + idxs.size)):
+        return slice(int(idxs[0]), int(idxs[0]) + idxs.size)
+    return idxs
+
+
 class ODEIntegrationComp(om.ExplicitComponent):
     """
     A component to perform explicit integration with a generic ODE integrator/IVP solver.
@@ -60,7 +84,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self._reports = reports
         self._standalone_mode = standalone_mode
 
-        self._inputs_cache = ''
+        self._inputs_cache = None
+        self._inputs_cache_has_derivs = False
 
         self.x_size = 0
         self.p_size = 0
@@ -108,6 +133,34 @@ class ODEIntegrationComp(om.ExplicitComponent):
         p.setup()
         p.final_setup()
 
+        # The subproblem inputs are all outputs of the IndepVarComp in the ODEEvaluationGroup and are
+        # declared with the same units as the corresponding inputs of this component, so no unit
+        # conversion is necessary when values are written directly into the subproblem output vector.
+        self._subprob_outputs_data = p.model._outputs.asarray()
+
+        # The outputs of the state rate collector are the state rates, ordered as the states are ordered in x, so
+        # its output vector serves as a contiguous view of the state rate vector f.
+        self._subprob_state_rates = p.model._get_subsystem('ode_eval.state_rate_collector')._outputs.asarray()
+
+    def _get_subprob_output_idxs(self, prom_name):
+        """
+        Return the indices of the given promoted output in the output vector of the subproblem.
+
+        Parameters
+        ----------
+        prom_name : str
+            The promoted name of the output in the subproblem model.
+
+        Returns
+        -------
+        np.ndarray
+            The flat indices of the value of the output in the subproblem output vector.
+        """
+        model = self._eval_subprob.model
+        # For an output, get_source returns its own absolute name.
+        slc = model._outputs.get_slice_dict()[model.get_source(prom_name)]
+        return np.arange(slc.start, slc.stop, dtype=int)
+
     def _set_segment_index(self, idx):
         """
         Set the index of the segment being integrated.
@@ -166,6 +219,13 @@ class ODEIntegrationComp(om.ExplicitComponent):
         # The indices of each state's initial value in z
         self._state_idxs_in_z = {}
 
+        # Each state output depends on every input of the integration.
+        wrt = ['t_initial', 't_duration']
+        wrt.extend([f'states:{name}' for name in self.state_options])
+        wrt.extend([f'parameters:{name}' for name in self.parameter_options])
+        wrt.extend([f'controls:{name}' for name in self.control_options])
+        wrt.extend([f'polynomial_controls:{name}' for name in self.polynomial_control_options])
+
         for state_name, options in self.state_options.items():
             self._state_input_names[state_name] = f'states:{state_name}'
             self._state_output_names[state_name] = f'states_out:{state_name}'
@@ -190,27 +250,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
             self.state_idxs[state_name] = np.s_[self.x_size:self.x_size + state_size]
             self.x_size += state_size
 
-            self.declare_partials(of=self._state_output_names[state_name],
-                                  wrt='t_initial')
-
-            self.declare_partials(of=self._state_output_names[state_name],
-                                  wrt='t_duration')
-
-            for state_name_wrt in self.state_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'states:{state_name_wrt}')
-
-            for param_name_wrt in self.parameter_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'parameters:{param_name_wrt}')
-
-            for control_name_wrt in self.control_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'controls:{control_name_wrt}')
-
-            for control_name_wrt in self.polynomial_control_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'polynomial_controls:{control_name_wrt}')
+            self.declare_partials(of=self._state_output_names[state_name], wrt=wrt)
 
     def _setup_parameters(self):
         if self._standalone_mode:
@@ -225,6 +265,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
         # The indices of each parameter in p
         self.p_size = 0
         self.parameter_idxs = {}
+        self.parameter_sizes = {}
         self._parameter_idxs_in_theta = {}
         self._parameter_idxs_in_z = {}
         self._param_input_names = {}
@@ -239,7 +280,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
                            units=options['units'],
                            desc=f'value for parameter {param_name}')
 
-            param_size = np.prod(options['shape'], dtype=int)
+            self.parameter_sizes[param_name] = param_size = np.prod(options['shape'], dtype=int)
             self.parameter_idxs[param_name] = np.s_[self.p_size:self.p_size+param_size]
             self.p_size += param_size
 
@@ -254,13 +295,14 @@ class ODEIntegrationComp(om.ExplicitComponent):
         configure time in the parent ExplicitShooting transcription object.
         """
         self.u_size = 0
+        self.control_sizes = {}
         self._control_idxs_in_theta = {}
         self._control_idxs_in_z = {}
         self._control_input_names = {}
 
         for control_name, options in self.control_options.items():
             control_param_shape = (self._num_control_input_nodes,) + options['shape']
-            control_param_size = np.prod(control_param_shape, dtype=int)
+            self.control_sizes[control_name] = control_param_size = np.prod(control_param_shape, dtype=int)
             self._control_input_names[control_name] = f'controls:{control_name}'
 
             self._totals_wrt_names.append(self._control_input_names[control_name])
@@ -283,6 +325,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
         configure time in the parent ExplicitShooting transcription object.
         """
         self.up_size = 0
+        self.polynomial_control_sizes = {}
         self._polynomial_control_idxs_in_theta = {}
         self._polynomial_control_idxs_in_z = {}
         self._polynomial_control_input_names = {}
@@ -290,7 +333,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
         for name, options in self.polynomial_control_options.items():
             num_input_nodes = options['order'] + 1
             control_param_shape = (num_input_nodes,) + options['shape']
-            control_param_size = np.prod(control_param_shape, dtype=int)
+            self.polynomial_control_sizes[name] = control_param_size = np.prod(control_param_shape, dtype=int)
 
             self._polynomial_control_input_names[name] = f'polynomial_controls:{name}'
 
@@ -304,58 +347,62 @@ class ODEIntegrationComp(om.ExplicitComponent):
             self.up_size += control_param_size
 
     def _build_dx_dz_idxs(self):
-        self._partial_dx_dz_idxs = {}
+        """
+        Build the rows and columns of dx_dz which provide the partials of each state output wrt each input.
 
-        dx_dz_idx = 0
-        for output_state, output_state_options in self.state_options.items():
+        With dx_dz_out reshaped to (num_nodes, x_size, z_size), the partial of each state output wrt each input
+        is a basic slice of that array, which is stored here along with the output and input names so that
+        compute_partials can simply iterate over them.
+        """
+        self._z_input_slices = wrt_cols = [('t_initial', np.s_[self.x_size:self.x_size + 1]),
+                                           ('t_duration', np.s_[self.x_size + 1:self.x_size + 2])]
+        wrt_cols.extend([(self._state_input_names[name], self._state_idxs_in_z[name])
+                         for name in self.state_options])
+        wrt_cols.extend([(self._param_input_names[name], self._parameter_idxs_in_z[name])
+                         for name in self.parameter_options])
+        wrt_cols.extend([(self._control_input_names[name], self._control_idxs_in_z[name])
+                         for name in self.control_options])
+        wrt_cols.extend([(self._polynomial_control_input_names[name], self._polynomial_control_idxs_in_z[name])
+                         for name in self.polynomial_control_options])
+
+        self._partial_dx_dz_idxs = []
+        for output_state in self.state_options:
             output_name = self._state_output_names[output_state]
-            output_state_size = np.prod(output_state_options['shape'])
-
-            # Column indices wrt each initial state value
-            for input_state, input_state_options in self.state_options.items():
-                input_name = self._state_input_names[input_state]
-                input_size = np.prod(input_state_options['shape'])
-                idxs = np.s_[:, dx_dz_idx: dx_dz_idx + output_state_size * input_size]
-                self._partial_dx_dz_idxs[output_name, input_name] = idxs
-                dx_dz_idx += output_state_size * input_size
-
-            # Column indices wrt t_initial and t_duration
-            self._partial_dx_dz_idxs[output_name, 't_initial'] = np.s_[:, dx_dz_idx]
-            self._partial_dx_dz_idxs[output_name, 't_duration'] = np.s_[:, dx_dz_idx + 1]
-            dx_dz_idx += 2
-
-            # Column indices wrt the parameters
-            for param, param_options in self.parameter_options.items():
-                input_name = self._param_input_names[param]
-                input_size = np.prod(param_options['shape'])
-                idxs = np.s_[:, dx_dz_idx: dx_dz_idx + output_state_size * input_size]
-                self._partial_dx_dz_idxs[output_name, input_name] = idxs
-                dx_dz_idx += output_state_size * input_size
-
-            # Column indices wrt the controls
-            for control, control_options in self.control_options.items():
-                input_name = self._control_input_names[control]
-                input_size = np.prod(control_options['shape']) * self._input_grid_data.subset_num_nodes['control_input']
-                idxs = np.s_[:, dx_dz_idx: dx_dz_idx + output_state_size * input_size]
-                self._partial_dx_dz_idxs[output_name, input_name] = idxs
-                dx_dz_idx += output_state_size * input_size
-
-            # Column indices wrt the polynomial controls
-            for pc, pc_options in self.polynomial_control_options.items():
-                input_name = self._polynomial_control_input_names[pc]
-                input_size = np.prod(pc_options['shape']) * (pc_options['order'] + 1)
-                idxs = np.s_[:, dx_dz_idx: dx_dz_idx + output_state_size * input_size]
-                self._partial_dx_dz_idxs[output_name, input_name] = idxs
-                dx_dz_idx += output_state_size * input_size
+            rows = self.state_idxs[output_state]
+            for input_name, cols in wrt_cols:
+                self._partial_dx_dz_idxs.append((output_name, input_name, rows, cols))
+
+        # The indices of z in the input vector are only available once the vectors are set up.
+        self._z_input_idxs = None
+
+    def _get_z_input_idxs(self, inputs):
+        """
+        Return the indices of each element of the integration parameter vector, z, in the given input vector.
+
+        Parameters
+        ----------
+        inputs : Vector
+            The input vector of this component.
+
+        Returns
+        -------
+        np.ndarray
+            The flat indices of each element of z in the data of the input vector.
+        """
+        if self._z_input_idxs is None:
+            slices = inputs.get_slice_dict()
+            self._z_input_idxs = np.zeros(self.z_size, dtype=int)
+            for input_name, z_idxs in self._z_input_slices:
+                slc = slices[f'{self.pathname}.{input_name}']
+                self._z_input_idxs[z_idxs] = np.arange(slc.start, slc.stop, dtype=int)
+        return self._z_input_idxs
 
     def _setup_storage(self):
         if self._standalone_mode:
             self._configure_storage()
 
     def _configure_storage(self):
-        igd = self._input_grid_data
         ogd = self._output_grid_data
-        control_input_node_ptau = igd.node_ptau[igd.subset_node_indices['control_input']]
 
         # allocate the ODE parameter vector
         self.theta_size = 2 + self.p_size + self.u_size + self.up_size
@@ -363,48 +410,33 @@ class ODEIntegrationComp(om.ExplicitComponent):
         # allocate the integration parameter vector
         self.z_size = self.x_size + self.theta_size
 
-        start_z = 0
-
-        x_output_names = []
-        z_input_names = []
-
-        for state_name, options in self.state_options.items():
-            state_size = np.prod(options['shape'], dtype=int)
-            self._state_idxs_in_z[state_name] = np.s_[start_z: start_z + state_size]
-            x_output_names.extend([self._state_output_names[state_name]] * state_size)
-            z_input_names.extend([self._state_input_names[state_name]] * state_size)
-            start_z += state_size
+        # The states occupy the first x_size elements of z, in the same order as in x.
+        # The size of each variable was computed when it was configured.
+        for state_name in self.state_options:
+            self._state_idxs_in_z[state_name] = self.state_idxs[state_name]
 
         # Add 2 to account for t_initial, t_duration
         start_z = self.x_size + 2
         start_theta = 2
-        z_input_names.extend(['t_initial', 't_duration'])
 
-        for param_name, options in self.parameter_options.items():
-            param_size = np.prod(options['shape'], dtype=int)
+        for param_name in self.parameter_options:
+            param_size = self.parameter_sizes[param_name]
             self._parameter_idxs_in_z[param_name] = np.s_[start_z: start_z + param_size]
             self._parameter_idxs_in_theta[param_name] = np.s_[start_theta: start_theta+param_size]
-            z_input_names.extend([self._param_input_names[param_name]] * param_size)
             start_z += param_size
             start_theta += param_size
 
-        for control_name, options in self.control_options.items():
-            control_param_shape = (len(control_input_node_ptau),) + options['shape']
-            control_param_size = np.prod(control_param_shape, dtype=int)
+        for control_name in self.control_options:
+            control_param_size = self.control_sizes[control_name]
             self._control_idxs_in_z[control_name] = np.s_[start_z:start_z + control_param_size]
             self._control_idxs_in_theta[control_name] = np.s_[start_theta:start_theta+control_param_size]
-            z_input_names.extend([self._control_input_names[control_name]] * control_param_size)
             start_z += control_param_size
             start_theta += control_param_size
 
-        for pc_name, options in self.polynomial_control_options.items():
-            num_input_nodes = options['order'] + 1
-            control_param_shape = (num_input_nodes,) + options['shape']
-            control_param_size = np.prod(control_param_shape, dtype=int)
+        for pc_name in self.polynomial_control_options:
+            control_param_size = self.polynomial_control_sizes[pc_name]
             self._polynomial_control_idxs_in_z[pc_name] = np.s_[start_z:start_z + control_param_size]
             self._polynomial_control_idxs_in_theta[pc_name] = np.s_[start_theta:start_theta+control_param_size]
-            z_input_names.extend([self._polynomial_control_input_names[pc_name]] * control_param_size)
-
             start_z += control_param_size
             start_theta += control_param_size
 
@@ -413,10 +445,20 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
         self._nnps = ogd.subset_num_nodes_per_segment['all']
 
+        # The fraction of the phase duration elapsed at each output node of each segment, such that the times of
+        # the output nodes are t_initial + frac * t_duration.
+        self._eval_nodes_frac = [0.5 * (ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]] + 1)
+                                 for i in range(ogd.num_segments)]
+        self._eval_nodes_frac_all = np.concatenate(self._eval_nodes_frac)
+
         nn = sum(self._nnps)
         self._t_out = np.zeros((nn, 1))
         self._x_out = np.zeros((nn, self.x_size))
 
+        # Any cached solution refers to storage from a previous setup.
+        self._inputs_cache = None
+        self._inputs_cache_has_derivs = False
+
         if self.options['propagate_derivs']:
             self._dx_dz_out = np.zeros((nn, self.x_size * self.z_size))
             self._dt_dz_out = np.zeros((nn, self.z_size))
@@ -424,9 +466,16 @@ class ODEIntegrationComp(om.ExplicitComponent):
             self._dx_dz_out = None
             self._dt_dz_out = None
 
+        # Build a map for obtaining each state output from x
+        self._state_output_plan = [(self._state_output_names[name], self.state_idxs[name])
+                                   for name in self.state_options]
+
         # Build a map for obtaining the partials from dx_dz
         self._build_dx_dz_idxs()
 
+        # Storage for the ODE parameters, gathered from the inputs by each call to _propagate
+        self._theta = np.zeros(self.theta_size)
+
         # Allocate the initial values for dx_dz and dt_dz
         self._dx_dz_0 = np.zeros((self.x_size, self.z_size))
         self._dx_dz_0[:, :self.x_size] = np.eye(self.x_size)
@@ -434,8 +483,107 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self._dt_dz_0 = np.zeros((1, self.z_size))
         self._dt_dz_0[0, self.x_size] = 1.
 
-        self._dtheta_dz = np.zeros((self.theta_size, self.z_size))
-        self._dtheta_dz[:, -self.theta_size:] = np.eye(self.theta_size)
+        # Storage for the initial augmented state, y0 = [x0, dx_dz_0, dt_dz_0], and views of each of its parts.
+        # The initial states are gathered from the inputs directly into the view of x0, which is also used as the
+        # initial state when only the primal states are propagated.
+        self._y0 = np.zeros(self.x_size + self.x_size * self.z_size + self.z_size)
+        self._y0_x = self._y0[:self.x_size]
+        self._y0_dx_dz = self._y0[self.x_size:-self.z_size].reshape((self.x_size, self.z_size))
+        self._y0_dt_dz = self._y0[-self.z_size:].reshape((1, self.z_size))
+
+        # Storage for the evaluated ODE and its derivatives, reused by each call to eval_ode.
+        self._f = np.zeros((self.x_size, 1))
+        # f_x and f_t are stored side by side so that the sensitivity rates f_x @ dx_dz + f_t @ dt_dz can be
+        # computed as a single matrix product with the stacked [dx_dz; dt_dz] from the augmented state.
+        self._f_xt = np.zeros((self.x_size, self.x_size + 1))
+        self._f_x = self._f_xt[:, :self.x_size]
+        self._f_t = self._f_xt[:, self.x_size:]
+        self._f_theta = np.zeros((self.x_size, self.theta_size))
+
+        # The column of t_duration in the integration parameter vector, z
+        self._t_duration_col_in_z = self.x_size + 1
+
+        self._configure_subprob_idxs()
+        self._configure_totals()
+
+    def _configure_subprob_idxs(self):
+        """
+        Build the indices of t, x, and theta in the output vector of the subproblem.
+
+        These allow the inputs to be transcribed to the subproblem with a single indexed copy each, rather than
+        looping over every variable on each evaluation of the ODE.
+        """
+        self._subprob_t_idxs = self._get_subprob_output_idxs(self.time_options['name'])
+        self._subprob_x_idxs = np.zeros(self.x_size, dtype=int)
+        self._subprob_theta_idxs = np.zeros(self.theta_size, dtype=int)
+
+        self._subprob_theta_idxs[0] = self._get_subprob_output_idxs('t_initial')
+        self._subprob_theta_idxs[1] = self._get_subprob_output_idxs('t_duration')
+
+        for name in self.state_options:
+            self._subprob_x_idxs[self.state_idxs[name]] = self._get_subprob_output_idxs(f'states:{name}')
+
+        for name in self.parameter_options:
+            self._subprob_theta_idxs[self._parameter_idxs_in_theta[name]] = \
+                self._get_subprob_output_idxs(f'parameters:{name}')
+
+        for name in self.control_options:
+            self._subprob_theta_idxs[self._control_idxs_in_theta[name]] = \
+                self._get_subprob_output_idxs(f'controls:{name}')
+
+        for name in self.polynomial_control_options:
+            self._subprob_theta_idxs[self._polynomial_control_idxs_in_theta[name]] = \
+                self._get_subprob_output_idxs(f'polynomial_controls:{name}')
+
+        # The subproblem outputs are typically laid out in the same order as x and theta, in which case each
+        # copy can be done with a slice rather than a fancy-indexed scatter.
+        self._subprob_t_idxs = _as_slice_if_contiguous(self._subprob_t_idxs)
+        self._subprob_x_idxs = _as_slice_if_contiguous(self._subprob_x_idxs)
+        self._subprob_theta_idxs = _as_slice_if_contiguous(self._subprob_theta_idxs)
+
+    def _configure_totals(self):
+        """
+        Prepare the computation of the total derivatives of the state rates in the subproblem.
+
+        The totals are computed as a single array whose rows are ordered the same as the state vector, x.
+        Here we build the indices which map the columns of that array to the columns of f_t, f_x, and f_theta.
+        """
+        t_name = self.time_options['name']
+
+        self._totals_xt_cols = np.zeros(self.x_size + 1, dtype=int)
+        self._totals_x_cols = self._totals_xt_cols[:self.x_size]
+        self._totals_t_cols = self._totals_xt_cols[self.x_size:]
+        self._totals_theta_cols = np.zeros(self.theta_size, dtype=int)
+
+        wrt_cols = {t_name: (self._totals_t_cols, np.s_[0:1]),
+                    't_initial': (self._totals_theta_cols, np.s_[0:1]),
+                    't_duration': (self._totals_theta_cols, np.s_[1:2])}
+
+        for name in self.state_options:
+            wrt_cols[self._state_input_names[name]] = (self._totals_x_cols, self.state_idxs[name])
+
+        for name in self.parameter_options:
+            wrt_cols[self._param_input_names[name]] = (self._totals_theta_cols, self._parameter_idxs_in_theta[name])
+
+        for name in self.control_options:
+            wrt_cols[self._control_input_names[name]] = (self._totals_theta_cols, self._control_idxs_in_theta[name])
+
+        for name in self.polynomial_control_options:
+            wrt_cols[self._polynomial_control_input_names[name]] = (self._totals_theta_cols,
+                                                                    self._polynomial_control_idxs_in_theta[name])
+
+        # The columns of the totals are ordered by the wrt names, which depends on the order in which the
+        # variables were configured.
+        start_col = 0
+        for wrt_name in self._totals_wrt_names:
+            cols, idxs = wrt_cols[wrt_name]
+            size = idxs.stop - idxs.start
+            cols[idxs] = np.arange(start_col, start_col + size, dtype=int)
+            start_col += size
+
+        # The _TotalJacInfo is created the first time derivatives are evaluated, so that integrations which only
+        # propagate the primal states never set it up.  It is None until then, and False if it is not available.
+        self._totals_jac_info = None
 
     def setup(self):
         """
@@ -452,6 +600,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
         self._num_output_rows = ogd.subset_num_nodes['all']
 
+        self._state_rate_of_names = []
         self._totals_of_names = []
         self._totals_wrt_names = []
 
@@ -463,9 +612,9 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self._setup_states()
         self._setup_storage()
 
-    def _subprob_run_model(self, x, t, theta, linearize=True):
+    def _subprob_run_model(self, x, t, theta):
         """
-        Set inputs to the model given x, t, and theta, evaluate the model, and linearize if requested.
+        Set inputs to the model given x, t, and theta and evaluate the model.
 
         Parameters
         ----------
@@ -475,47 +624,18 @@ class ODEIntegrationComp(om.ExplicitComponent):
             The current time of the integration.
         theta : np.ndarray
             A flattened, contiguous vector of the ODE parameter values.
-        linearize : bool
-            If True, linearize the model after calling run_model.
-
-        Returns
-        -------
-
         """
         subprob = self._eval_subprob
-        t_units = self.time_options['units']
-        t_name = self.time_options['name']
-
-        # transcribe time
-        subprob.set_val(t_name, t, units=t_units)
-        subprob.set_val('t_initial', theta[0], units=t_units)
-        subprob.set_val('t_duration', theta[1], units=t_units)
+        data = self._subprob_outputs_data
 
-        # transcribe states
-        for name in self.state_options:
-            input_name = self._state_input_names[name]
-            subprob.set_val(input_name, x[0, self.state_idxs[name]])
-
-        # transcribe parameters
-        for name in self.parameter_options:
-            input_name = self._param_input_names[name]
-            subprob.set_val(input_name, theta[self._parameter_idxs_in_theta[name]])
-
-        # transcribe controls
-        for name in self.control_options:
-            input_name = self._control_input_names[name]
-            subprob.set_val(input_name, theta[self._control_idxs_in_theta[name]])
-
-        for name in self.polynomial_control_options:
-            input_name = self._polynomial_control_input_names[name]
-            subprob.set_val(input_name, theta[self._polynomial_control_idxs_in_theta[name]])
+        # transcribe time, states, and the ODE parameters
+        data[self._subprob_t_idxs] = t
+        data[self._subprob_x_idxs] = x[0, :]
+        data[self._subprob_theta_idxs] = theta
 
         # Re-run in case the inputs have changed.
         subprob.run_model()
 
-        if linearize:
-            subprob.model._linearize(None)
-
     def eval_ode(self, x, t, theta, eval_solution=True, eval_derivs=True):
         """
         Evaluate the derivative of the ODE output rates wrt the inputs.
@@ -526,6 +646,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
         together, but in this implementation the interpolation is part of the execution of the ODE
         and the chained derivatives are captured correctly there.
 
+        The returned arrays are storage owned by this component and are overwritten by the next call to eval_ode.
+
         Parameters
         ----------
         x : np.ndarray
@@ -554,65 +676,63 @@ class ODEIntegrationComp(om.ExplicitComponent):
             A matrix of the derivatives of each element of the rates `f` wrt the parameters `theta`, or None
             if eval_derivs is False.
         """
-        t_name = self.time_options['name']
-        self._subprob_run_model(x, t, theta, linearize=False)
+        self._subprob_run_model(x, t, theta)
 
         # pack the resulting array
         if eval_solution:
-            f = np.zeros((self.x_size, 1))
-            for name in self.state_options:
-                state_rate = self._eval_subprob.get_val(f'state_rate_collector.state_rates:{name}_rate')
-                f[self.state_idxs[name]] = state_rate.reshape((self.state_sizes[name], 1))
+            f = self._f
+            f[:, 0] = self._subprob_state_rates
         else:
             f = None
 
         if eval_derivs:
-            f_t = np.zeros((self.x_size, 1))
-            f_x = np.zeros((self.x_size, self.x_size))
-            f_theta = np.zeros((self.x_size, self.theta_size))
-
-            totals = self._eval_subprob.compute_totals(of=self._state_rate_of_names,
-                                                       wrt=self._totals_wrt_names,
-                                                       use_abs_names=False)
-
-            for state_name in self.state_options:
-                of_name = f'state_rate_collector.state_rates:{state_name}_rate'
-                idxs = self.state_idxs[state_name]
-
-                f_t[self.state_idxs[state_name]] = totals[of_name, t_name]
-
-                for state_name_wrt in self.state_options:
-                    idxs_wrt = self.state_idxs[state_name_wrt]
-                    px_px = totals[of_name, self._state_input_names[state_name_wrt]]
-                    f_x[idxs, idxs_wrt] = px_px.ravel()
-
-                f_theta[idxs, 0] = totals[of_name, 't_initial']
-                f_theta[idxs, 1] = totals[of_name, 't_duration']
+            if self._totals_jac_info is None:
+                self._totals_jac_info = self._get_totals_jac_info()
 
-                for param_name_wrt in self.parameter_options:
-                    idxs_wrt = self._parameter_idxs_in_theta[param_name_wrt]
-                    px_pp = totals[of_name, self._param_input_names[param_name_wrt]]
-                    f_theta[idxs, idxs_wrt] = px_pp.ravel()
-
-                for control_name_wrt in self.control_options:
-                    idxs_wrt = self._control_idxs_in_theta[control_name_wrt]
-                    px_pu = totals[of_name, self._control_input_names[control_name_wrt]]
-                    f_theta[idxs, idxs_wrt] = px_pu.ravel()
+            if self._totals_jac_info is not False:
+                totals = self._totals_jac_info.compute_totals()
+            else:
+                totals = self._eval_subprob.compute_totals(of=self._state_rate_of_names, wrt=self._totals_wrt_names,
+                                                           return_format='array')
 
-                for pc_name_wrt in self.polynomial_control_options:
-                    idxs_wrt = self._polynomial_control_idxs_in_theta[pc_name_wrt]
-                    px_ppc = totals[of_name, self._polynomial_control_input_names[pc_name_wrt]]
-                    f_theta[idxs, idxs_wrt] = px_ppc.ravel()
+            np.take(totals, self._totals_xt_cols, axis=1, out=self._f_xt)
+            f_x = self._f_x
+            f_t = self._f_t
+            f_theta = np.take(totals, self._totals_theta_cols, axis=1, out=self._f_theta)
 
         else:
             f_x = f_t = f_theta = None
 
         return f, f_x, f_t, f_theta
 
-    def _f_augmented(self, t, y, theta, dtheta_dz):
+    def _get_totals_jac_info(self):
         """
-        The ODE-callable function where y is the augmented state vector, theta are the ODE parameters, and dtheta_dz
-        are the sensitivities of the ODE parameters to the integration parameters.
+        Return a reusable object for computing the totals of the state rates in the subproblem.
+
+        Reusing the same _TotalJacInfo avoids rebuilding the total jacobian metadata on each evaluation of the ODE.
+        Since _TotalJacInfo is private to OpenMDAO, if its constructor is not compatible with the installed version
+        then False is returned, and the totals are computed with the public Problem.compute_totals instead.
+
+        Returns
+        -------
+        _TotalJacInfo or bool
+            The object used to compute the totals, or False if it is not available.
+        """
+        if _TotalJacInfo is None:
+            return False
+        try:
+            return _TotalJacInfo(self._eval_subprob, of=self._state_rate_of_names, wrt=self._totals_wrt_names,
+                                 use_abs_names=False, return_format='array', driver_scaling=False)
+        except TypeError:
+            return False
+
+    def _f_augmented(self, t, y, theta):
+        """
+        The ODE-callable function where y is the augmented state vector and theta are the ODE parameters.
+
+        Since the ODE parameters are the integration parameters with the first num_x elements removed, their
+        sensitivities wrt the integration parameters, dtheta_dz, are [0 | I]. This structure is exploited when
+        computing the rates of the state sensitivities, so dtheta_dz is never formed.
 
         Parameters
         ----------
@@ -622,10 +742,6 @@ class ODEIntegrationComp(om.ExplicitComponent):
             The augmented state vector.
         theta : np.array
             The ODE parameter vector. The first two elements are t_initial and t_duration.
-        dtheta_dz : np.array
-            The sensitivities of the ODE parameters wrt the integration parameters. Since the ODE parameters are
-            just the integration parameters with the first num_x columns removed, this is a matrix of shape
-            (num_dtheta, num_z - num_x).
 
         Returns
         -------
@@ -637,22 +753,32 @@ class ODEIntegrationComp(om.ExplicitComponent):
         n_z = n_x + n_theta
 
         x = y[:n_x].reshape((1, n_x))
-        td = theta[1]
+        inv_td = 1.0 / theta[1]
+        td_col = self._t_duration_col_in_z
 
-        dx_dz = y[n_x:n_x + n_x * n_z].reshape((n_x, n_z))
-        dt_dz = y[-n_z:].reshape((1, n_z))
+        # dx_dz and dt_dz are stacked contiguously in y
+        dxt_dz = y[n_x:].reshape((n_x + 1, n_z))
 
         x_dot, f_x, f_t, f_theta = self.eval_ode(x, t, theta, eval_solution=True, eval_derivs=True)
 
-        dh_dz = np.zeros((1, n_z))
-        dh_dz[0, n_x+1] = 1./td
-        dt_dz_dot = dh_dz
-
-        dx_dz_dot = f_x @ dx_dz + f_t @ dt_dz + f_theta @ dtheta_dz + x_dot @ dt_dz_dot
-
-        y_dot = np.concatenate((x_dot.ravel(),
-                                dx_dz_dot.ravel(),
-                                dt_dz_dot.ravel()))
+        # Each piece of y_dot is written directly into a view of the returned array.  A new array is needed on
+        # each call since solve_ivp holds on to the values returned by previous evaluations.
+        y_dot = np.empty(n_x + n_x * n_z + n_z)
+        y_dot[:n_x] = x_dot[:, 0]
+        dx_dz_dot = y_dot[n_x:-n_z].reshape((n_x, n_z))
+        dt_dz_dot = y_dot[-n_z:]
+
+        # dt_dz_dot is zero except for its element wrt t_duration.
+        dt_dz_dot[:] = 0.0
+        dt_dz_dot[td_col] = inv_td
+
+        # dx_dz_dot = f_x @ dx_dz + f_t @ dt_dz + f_theta @ dtheta_dz + x_dot @ dt_dz_dot
+        # The first two terms are computed as [f_x | f_t] @ [dx_dz; dt_dz] in a single matrix product.
+        # Since dtheta_dz is [0 | I], the third term is f_theta added to the last n_theta columns, and since
+        # dt_dz_dot has a single nonzero element, the last term only affects the t_duration column.
+        np.matmul(self._f_xt, dxt_dz, out=dx_dz_dot)
+        dx_dz_dot[:, n_x:] += f_theta
+        dx_dz_dot[:, td_col] += x_dot[:, 0] * inv_td
 
         return y_dot
 
@@ -680,7 +806,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
         x_dot, _, _, _ = self.eval_ode(_x, t, theta, eval_solution=True, eval_derivs=False)
 
-        return x_dot.ravel()
+        # The solvers in solve_ivp may hold on to the returned rates, so they cannot share storage.
+        return x_dot.ravel().copy()
 
     def _propagate(self, inputs, propagate_derivs=None, x_out=None, t_out=None, dx_dz_out=None,
                    dt_dz_out=None):
@@ -714,10 +841,12 @@ class ODEIntegrationComp(om.ExplicitComponent):
             The integrated states at each node.
         t_out : np.array
             The time (or integration variable) value at each node.
-        dx_dz_out : np.array
-            The derivative of each state at each node with respect to the initial integration parameters.
-        dt_dz_out : np.array
-            The derivative of time at each node with respect to the initial integration parameters.
+        dx_dz_out : np.array or None
+            The derivative of each state at each node with respect to the initial integration parameters, or None
+            if derivatives were not propagated.
+        dt_dz_out : np.array or None
+            The derivative of time at each node with respect to the initial integration parameters, or None if
+            derivatives were not propagated.
         """
         method = self.options['method']
         first_step = self.options['first_step']
@@ -742,28 +871,14 @@ class ODEIntegrationComp(om.ExplicitComponent):
         n_z = n_x + n_theta
         nnps = self._nnps
 
-        # Extract the input values
-        x0 = np.zeros((self.x_size,))
-        theta = np.zeros((self.theta_size,))
-
-        for state_name in self.state_options:
-            state_initial_val = inputs[self._state_input_names[state_name]]
-            x0[self.state_idxs[state_name]] = state_initial_val.ravel()
-
-        theta[0] = t_initial = inputs['t_initial']
-        theta[1] = t_duration = inputs['t_duration']
-
-        for param_name in self.parameter_options:
-            param_val = inputs[self._param_input_names[param_name]]
-            theta[self._parameter_idxs_in_theta[param_name]] = param_val.ravel()
-
-        for control_name in self.control_options:
-            control_vals = inputs[self._control_input_names[control_name]]
-            theta[self._control_idxs_in_theta[control_name]] = control_vals.ravel()
-
-        for pc_name in self.polynomial_control_options:
-            pc_vals = inputs[self._polynomial_control_input_names[pc_name]]
-            theta[self._polynomial_control_idxs_in_theta[pc_name]] = pc_vals.ravel()
+        # Extract the input values.  Since z = [x0, theta], both are gathered from the input vector with a
+        # single precomputed index array.
+        z_input_idxs = self._get_z_input_idxs(inputs)
+        input_data = inputs.asarray()
+        x0 = np.take(input_data, z_input_idxs[:n_x], out=self._y0_x)
+        theta = np.take(input_data, z_input_idxs[n_x:], out=self._theta)
+        t_initial = theta[0]
+        t_duration = theta[1]
 
         if _propagate_derivs:
             if dx_dz_out is None:
@@ -771,29 +886,34 @@ class ODEIntegrationComp(om.ExplicitComponent):
             if dt_dz_out is None:
                 dt_dz_out = np.zeros((nn, self.z_size))
 
-            y0 = np.concatenate((x0.ravel(), self._dx_dz_0.ravel(), self._dt_dz_0.ravel()))
+            y0 = self._y0
+            self._y0_dx_dz[...] = self._dx_dz_0
+            self._y0_dt_dz[...] = self._dt_dz_0
         else:
             dx_dz_out = None
             dt_dz_out = None
-            y0 = x0.ravel()
+            y0 = self._y0_x
+
+        if t_duration == 0.0:
+            if not self._propagate_zero_duration(x0, theta, x_out, t_out, dx_dz_out, dt_dz_out):
+                dx_dz_out = dt_dz_out = None
+            return x_out, t_out, dx_dz_out, dt_dz_out
 
         row_seg_i = 0
 
         for i in range(ogd.num_segments):
             self._set_segment_index(i)
 
-            eval_nodes_ptau = ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]]
-
-            t_eval_seg = t_initial + 0.5 * (eval_nodes_ptau + 1) * t_duration
+            t_eval_seg = t_initial + self._eval_nodes_frac[i] * t_duration
             t_span_seg = (t_eval_seg[0], t_eval_seg[-1])
 
             if _propagate_derivs:
                 # The augmented initial state vector
                 sol = solve_ivp(self._f_augmented, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0,
-                                args=(theta, self._dtheta_dz), method=method, first_step=first_step, max_step=max_step,
-                                atol=atol, rtol=rtol)
-                dx_dz_out[row_seg_i:row_seg_i+nnps[i], :] = sol.y.T[:, n_x:n_x+n_x*n_z]
-                dt_dz_out[row_seg_i:row_seg_i+nnps[i], :] = sol.y.T[:, -n_z:]
+                                args=(theta,), method=method, first_step=first_step,
+                                max_step=max_step, atol=atol, rtol=rtol)
+                np.copyto(dx_dz_out[row_seg_i:row_seg_i+nnps[i], :], sol.y[n_x:n_x+n_x*n_z, :].T)
+                np.copyto(dt_dz_out[row_seg_i:row_seg_i+nnps[i], :], sol.y[-n_z:, :].T)
             else:
                 sol = solve_ivp(self._f_primal, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0, args=(theta,),
                                 method=method, first_step=first_step, max_step=max_step, atol=atol, rtol=rtol)
@@ -801,13 +921,95 @@ class ODEIntegrationComp(om.ExplicitComponent):
             if not sol.success:
                 raise om.AnalysisError(f'solve_ivp failed: {sol.message}')
 
-            x_out[row_seg_i:row_seg_i+nnps[i], :] = sol.y.T[:, :n_x]  # Save solution to the output nodes
+            # Save solution to the output nodes. The rows of sol.y are sliced before transposing, so each copy
+            # reads only the needed rows of sol.y.
+            np.copyto(x_out[row_seg_i:row_seg_i+nnps[i], :], sol.y[:n_x, :].T)
             t_out[row_seg_i:row_seg_i + nnps[i], 0] = sol.t
-            y0 = sol.y.T[-1, :]  # Set initial y for the next segment
+            np.copyto(y0, sol.y[:, -1])  # Set initial y for the next segment
             row_seg_i += nnps[i]  # Increment node associated with the start of the next segment
 
         return x_out, t_out, dx_dz_out, dt_dz_out
 
+    def _propagate_zero_duration(self, x0, theta, x_out, t_out, dx_dz_out=None, dt_dz_out=None):
+        """
+        Populate the outputs of the propagation for a phase of zero duration without integrating.
+
+        Every output node is at t_initial and the states remain at their initial values.  The only nonzero
+        sensitivities, other than the identity wrt the initial states and t_initial, are wrt t_duration, where
+        the nodes advance with their fraction of the phase and the states advance with the state rates at the
+        start of the phase.  The latter requires that the rates do not vary with the controls across the phase,
+        and so is only available for phases without controls or polynomial controls. Otherwise only the states
+        and time are populated.
+
+        Parameters
+        ----------
+        x0 : np.array
+            The initial state vector.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        x_out : np.array
+            Storage for the states at each node.
+        t_out : np.array
+            Storage for the time at each node.
+        dx_dz_out : np.array or None
+            Storage for the derivatives of the states at each node wrt the integration parameters, or None if
+            derivatives are not being propagated.
+        dt_dz_out : np.array or None
+            Storage for the derivatives of time at each node wrt the integration parameters, or None if derivatives
+            are not being propagated.
+
+        Returns
+        -------
+        bool
+            True if the sensitivities were populated.
+        """
+        n_x = self.x_size
+        td_col = self._t_duration_col_in_z
+
+        x_out[...] = x0
+        t_out[...] = theta[0]
+
+        # The controls are interpolated in a segment tau space which is undefined for a zero duration.
+        if dx_dz_out is None or self.control_options or self.polynomial_control_options:
+            return False
+
+        frac = self._eval_nodes_frac_all
+
+        dt_dz_out[...] = self._dt_dz_0
+        dt_dz_out[:, td_col] = frac
+
+        # The tau outputs of the subproblem are not finite for a zero duration, but without controls they are not
+        # connected to anything, so the rates are unaffected.
+        self._set_segment_index(0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_dot, _, _, _ = self.eval_ode(x0.reshape((1, n_x)), theta[0], theta, eval_solution=True,
+                                           eval_derivs=False)
+
+        dx_dz = dx_dz_out.reshape((-1, n_x, self.z_size))
+        dx_dz[...] = self._dx_dz_0
+        dx_dz[:, :, td_col] = np.outer(frac, x_dot[:, 0])
+
+        return True
+
+    def _inputs_match_cache(self, inputs):
+        """
+        Return True if the given inputs are those of the cached integration.
+
+        The input values are compared directly against a copy stored with the cached integration, which is
+        cheaper than hashing them on every call.
+
+        Parameters
+        ----------
+        inputs : Vector
+            The inputs of the integration.
+
+        Returns
+        -------
+        bool
+            True if the cached integration was performed with the same input values.
+        """
+        return self._inputs_cache is not None and np.array_equal(inputs.asarray(), self._inputs_cache)
+
     def compute(self, inputs, outputs):
         """
         Compute propagated state values.
@@ -821,12 +1023,13 @@ class ODEIntegrationComp(om.ExplicitComponent):
         """
         t_name = self.time_options['name']
 
-        inputs_hash = inputs.get_hash()
-        if inputs_hash != self._inputs_cache:
-            self._propagate(inputs=inputs, propagate_derivs=self.options['propagate_derivs'],
-                            x_out=self._x_out, t_out=self._t_out, dx_dz_out=self._dx_dz_out, dt_dz_out=self._dt_dz_out)
+        if not self._inputs_match_cache(inputs):
+            _, _, dx_dz, _ = self._propagate(inputs=inputs, propagate_derivs=self.options['propagate_derivs'],
+                                             x_out=self._x_out, t_out=self._t_out, dx_dz_out=self._dx_dz_out,
+                                             dt_dz_out=self._dt_dz_out)
 
-            self._inputs_cache = inputs_hash
+            self._inputs_cache = inputs.asarray().copy()
+            self._inputs_cache_has_derivs = dx_dz is not None
 
         t = self._t_out
         x = self._x_out
@@ -837,9 +1040,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
         outputs['t_final'] = inputs['t_initial'] + inputs['t_duration']
 
         # Extract the state values
-        for state_name in self.state_options:
-            of = self._state_output_names[state_name]
-            outputs[of] = x[:, self.state_idxs[state_name]]
+        for of, idxs in self._state_output_plan:
+            outputs[of] = x[:, idxs]
 
     def compute_partials(self, inputs, partials):
         """
@@ -852,39 +1054,31 @@ class ODEIntegrationComp(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        # Only propagate the ODE if our inputs have changed, otherwise use the cached outputs.
-        inputs_hash = inputs.get_hash()
-        if inputs_hash != self._inputs_cache:
-            self._propagate(inputs=inputs, propagate_derivs=True,
-                            x_out=self._x_out, t_out=self._t_out, dx_dz_out=self._dx_dz_out, dt_dz_out=self._dt_dz_out)
-            self._inputs_cache = inputs_hash
+        # Only propagate the ODE if our inputs have changed or the cached solution was computed without
+        # derivatives, otherwise use the cached outputs.
+        if not self._inputs_match_cache(inputs) or not self._inputs_cache_has_derivs:
+            # If propagate_derivs is False the derivative storage is allocated by the first call here.
+            _, _, dx_dz, dt_dz = self._propagate(inputs=inputs, propagate_derivs=True, x_out=self._x_out,
+                                                 t_out=self._t_out, dx_dz_out=self._dx_dz_out,
+                                                 dt_dz_out=self._dt_dz_out)
+            self._inputs_cache = inputs.asarray().copy()
+
+            if dx_dz is None:
+                self._inputs_cache_has_derivs = False
+                raise om.AnalysisError('The sensitivities of the integrated states cannot be computed for a phase '
+                                       'with controls or polynomial controls and t_duration of zero.')
+
+            self._dx_dz_out, self._dt_dz_out = dx_dz, dt_dz
+            self._inputs_cache_has_derivs = True
 
         t_name = self.time_options['name']
 
         dt_dz = self._dt_dz_out
-        dx_dz = self._dx_dz_out
 
         partials[t_name, 't_duration'] = dt_dz[:, self.x_size+1]
         partials[f'{t_name}_phase', 't_duration'] = dt_dz[:, self.x_size+1]
 
-        for state_name in self.state_options:
-            of = self._state_output_names[state_name]
-
-            for wrt_state_name in self.state_options:
-                wrt = self._state_input_names[wrt_state_name]
-                partials[of, wrt] = dx_dz[self._partial_dx_dz_idxs[of, wrt]]
-
-            partials[of, 't_initial'] = dx_dz[self._partial_dx_dz_idxs[of, 't_initial']]
-            partials[of, 't_duration'] = dx_dz[self._partial_dx_dz_idxs[of, 't_duration']]
-
-            for wrt_param_name in self.parameter_options:
-                wrt = self._param_input_names[wrt_param_name]
-                partials[of, wrt] = dx_dz[self._partial_dx_dz_idxs[of, wrt]]
-
-            for wrt_control_name in self.control_options:
-                wrt = self._control_input_names[wrt_control_name]
-                partials[of, wrt] = dx_dz[self._partial_dx_dz_idxs[of, wrt]]
+        dx_dz = self._dx_dz_out.reshape((-1, self.x_size, self.z_size))
 
-            for wrt_pc_name in self.polynomial_control_options:
-                wrt = self._polynomial_control_input_names[wrt_pc_name]
-                partials[of, wrt] = dx_dz[self._partial_dx_dz_idxs[of, wrt]]
+        for of, wrt, rows, cols in self._partial_dx_dz_idxs:
+            partials[of, wrt] = dx_dz[:, rows, cols]
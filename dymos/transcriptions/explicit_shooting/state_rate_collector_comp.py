@@ -14,6 +14,9 @@ class StateRateCollectorComp(om.ExplicitComponent):
     For explicit integration this is necessary when the output providing the state rate has
     different units than those defined in the state_options/time_options.
 
+    The outputs are added in the order of state_options and this component has no other outputs,
+    so its output vector is the contiguous vector of the state rates used by the ODEIntegrationComp.
+
     Parameters
     ----------
     vec_size : int
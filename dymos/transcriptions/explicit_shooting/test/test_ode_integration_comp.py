@@ -1,4 +1,6 @@
 import unittest
+import unittest.mock
+import warnings
 
 import numpy as np
 import openmdao.api as om
@@ -9,7 +11,8 @@ from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
 from dymos.transcriptions.explicit_shooting.ode_integration_comp import ODEIntegrationComp
 
-from dymos.phase.options import TimeOptionsDictionary, StateOptionsDictionary, ParameterOptionsDictionary
+from dymos.phase.options import TimeOptionsDictionary, StateOptionsDictionary, ParameterOptionsDictionary, \
+    ControlOptionsDictionary
 from dymos.transcriptions.grid_data import GridData
 
 
@@ -44,6 +47,38 @@ class SimpleODE(om.ExplicitComponent):
         partials['x_dot', 't'] = -2*t
 
 
+class OscillatorODE(om.ExplicitComponent):
+    """
+    A simple harmonic oscillator whose position and velocity are stored in a single vector-valued state.
+    """
+    def initialize(self):
+        self.options.declare('num_nodes', types=(int,))
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self.add_input('x', shape=(nn, 2), units='m')
+        self.add_input('k', shape=(nn,), units='1/s**2')
+
+        self.add_output('x_dot', shape=(nn, 2), units='m/s')
+
+        ar = np.arange(nn, dtype=int)
+        self.declare_partials(of='x_dot', wrt='x', rows=np.concatenate((2*ar, 2*ar+1)),
+                              cols=np.concatenate((2*ar+1, 2*ar)))
+        self.declare_partials(of='x_dot', wrt='k', rows=2*ar+1, cols=ar)
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        k = inputs['k']
+        outputs['x_dot'][:, 0] = x[:, 1]
+        outputs['x_dot'][:, 1] = -k * x[:, 0]
+
+    def compute_partials(self, inputs, partials):
+        nn = self.options['num_nodes']
+        partials['x_dot', 'x'][:nn] = 1.0
+        partials['x_dot', 'x'][nn:] = -inputs['k']
+        partials['x_dot', 'k'] = -inputs['x'][:, 0]
+
+
 class TestODEIntegrationComp(unittest.TestCase):
 
     def test_integrate_scalar_ode(self):
@@ -112,6 +147,209 @@ class TestODEIntegrationComp(unittest.TestCase):
 
         dymos_options['include_check_partials'] = False
 
+    def test_partials_without_propagate_derivs(self):
+        dymos_options['include_check_partials'] = True
+
+        gd = GridData(num_segments=2, transcription='gauss-lobatto', transcription_order=3)
+
+        time_options = TimeOptionsDictionary()
+        time_options['targets'] = 't'
+        time_options['units'] = 's'
+
+        state_options = {'x': StateOptionsDictionary()}
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 's**2'
+        state_options['x']['rate_source'] = 'x_dot'
+        state_options['x']['targets'] = ['x']
+
+        param_options = {'p': ParameterOptionsDictionary()}
+        param_options['p']['shape'] = (1,)
+        param_options['p']['units'] = 's**2'
+        param_options['p']['targets'] = ['p']
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem('integrator',
+                                 ODEIntegrationComp(input_grid_data=gd, time_options=time_options,
+                                                    state_options=state_options, parameter_options=param_options,
+                                                    control_options={}, polynomial_control_options={},
+                                                    ode_class=SimpleODE, ode_init_kwargs=None,
+                                                    propagate_derivs=False, atol=1.0E-12, rtol=1.0E-12))
+        prob.setup()
+        prob.set_val('integrator.states:x', 0.5)
+        prob.set_val('integrator.t_initial', 0.0)
+        prob.set_val('integrator.t_duration', 2.0)
+        prob.set_val('integrator.parameters:p', 1.0)
+
+        prob.run_model()
+
+        # The solution cached by compute has no derivatives, so compute_partials must propagate them.
+        cpd = prob.check_partials(compact_print=True, method='fd')
+        assert_check_partials(cpd, atol=1.0E-4, rtol=1.0E-4)
+
+        dymos_options['include_check_partials'] = False
+
+    def test_integrate_with_public_compute_totals(self):
+        dymos_options['include_check_partials'] = True
+
+        gd = GridData(num_segments=2, transcription='gauss-lobatto', transcription_order=3)
+
+        time_options = TimeOptionsDictionary()
+        time_options['targets'] = 't'
+        time_options['units'] = 's'
+
+        state_options = {'x': StateOptionsDictionary()}
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 's**2'
+        state_options['x']['rate_source'] = 'x_dot'
+        state_options['x']['targets'] = ['x']
+
+        param_options = {'p': ParameterOptionsDictionary()}
+        param_options['p']['shape'] = (1,)
+        param_options['p']['units'] = 's**2'
+        param_options['p']['targets'] = ['p']
+
+        # Without the private _TotalJacInfo the totals are computed with Problem.compute_totals.
+        with unittest.mock.patch('dymos.transcriptions.explicit_shooting.ode_integration_comp._TotalJacInfo', None):
+            prob = om.Problem()
+
+            prob.model.add_subsystem('integrator',
+                                     ODEIntegrationComp(input_grid_data=gd, time_options=time_options,
+                                                        state_options=state_options, parameter_options=param_options,
+                                                        control_options={}, polynomial_control_options={},
+                                                        ode_class=SimpleODE, ode_init_kwargs=None))
+            prob.setup()
+            prob.set_val('integrator.states:x', 0.5)
+            prob.set_val('integrator.t_initial', 0.0)
+            prob.set_val('integrator.t_duration', 2.0)
+            prob.set_val('integrator.parameters:p', 1.0)
+
+            prob.run_model()
+
+            self.assertIs(prob.model.integrator._totals_jac_info, False)
+
+            x = prob.get_val('integrator.states_out:x')
+            t = prob.get_val('integrator.time')
+
+            assert_near_equal(x, t**2 + 2 * t + 1.0 - 0.5 * np.exp(t), tolerance=1.0E-5)
+
+            cpd = prob.check_partials(compact_print=True, method='fd', out_stream=None)
+            assert_check_partials(cpd, atol=1.0E-4, rtol=1.0E-4)
+
+        dymos_options['include_check_partials'] = False
+
+    def test_integrate_zero_duration(self):
+        dymos_options['include_check_partials'] = True
+
+        gd = GridData(num_segments=2, transcription='gauss-lobatto', transcription_order=3)
+
+        time_options = TimeOptionsDictionary()
+        time_options['targets'] = 't'
+        time_options['units'] = 's'
+
+        state_options = {'x': StateOptionsDictionary()}
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 's**2'
+        state_options['x']['rate_source'] = 'x_dot'
+        state_options['x']['targets'] = ['x']
+
+        param_options = {'p': ParameterOptionsDictionary()}
+        param_options['p']['shape'] = (1,)
+        param_options['p']['units'] = 's**2'
+        param_options['p']['targets'] = ['p']
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem('integrator',
+                                 ODEIntegrationComp(input_grid_data=gd, time_options=time_options,
+                                                    state_options=state_options, parameter_options=param_options,
+                                                    control_options={}, polynomial_control_options={},
+                                                    ode_class=SimpleODE, ode_init_kwargs=None))
+        prob.setup()
+        prob.set_val('integrator.states:x', 0.5)
+        prob.set_val('integrator.t_initial', 1.0)
+        prob.set_val('integrator.t_duration', 0.0)
+        prob.set_val('integrator.parameters:p', 1.0)
+
+        # The degenerate tau of the subproblem should not produce numpy warnings.
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            prob.run_model()
+            cpd = prob.check_partials(compact_print=True, method='fd', out_stream=None)
+
+        assert_near_equal(prob.get_val('integrator.states_out:x'), 0.5 * np.ones((6, 1)))
+        assert_near_equal(prob.get_val('integrator.time'), np.ones((6, 1)))
+
+        # The state rate at the start of the phase is 0.5 - 1.0**2 + 1.0
+        frac = 0.5 * (gd.node_ptau + 1)
+        assert_near_equal(cpd['integrator']['states_out:x', 't_duration']['J_fwd'].ravel(), 0.5 * frac)
+        assert_check_partials(cpd, atol=1.0E-4, rtol=1.0E-4)
+
+        dymos_options['include_check_partials'] = False
+
+    def test_integrate_zero_duration_with_controls(self):
+        gd = GridData(num_segments=3, transcription='gauss-lobatto', transcription_order=3, compressed=True)
+
+        time_options = TimeOptionsDictionary()
+        time_options['units'] = 's'
+
+        state_options = {'x': StateOptionsDictionary(),
+                         'y': StateOptionsDictionary(),
+                         'v': StateOptionsDictionary()}
+
+        for name, units, rate_source, targets in [('x', 'm', 'xdot', []),
+                                                  ('y', 'm', 'ydot', []),
+                                                  ('v', 'm/s', 'vdot', ['v'])]:
+            state_options[name]['shape'] = (1,)
+            state_options[name]['units'] = units
+            state_options[name]['rate_source'] = rate_source
+            state_options[name]['targets'] = targets
+
+        param_options = {'g': ParameterOptionsDictionary()}
+        param_options['g']['shape'] = (1,)
+        param_options['g']['units'] = 'm/s**2'
+        param_options['g']['targets'] = ['g']
+
+        control_options = {'theta': ControlOptionsDictionary()}
+        control_options['theta']['shape'] = (1,)
+        control_options['theta']['units'] = 'rad'
+        control_options['theta']['targets'] = ['theta']
+
+        p = om.Problem()
+
+        p.model.add_subsystem('integrator',
+                              ODEIntegrationComp(ode_class=BrachistochroneODE, time_options=time_options,
+                                                 state_options=state_options, parameter_options=param_options,
+                                                 control_options=control_options, polynomial_control_options={},
+                                                 input_grid_data=gd, ode_init_kwargs=None))
+
+        p.setup()
+
+        p.set_val('integrator.states:x', 0.0)
+        p.set_val('integrator.states:y', 10.0)
+        p.set_val('integrator.states:v', 1.0)
+        p.set_val('integrator.t_initial', 2.0)
+        p.set_val('integrator.t_duration', 0.0)
+        p.set_val('integrator.parameters:g', 9.80665)
+        p.set_val('integrator.controls:theta', np.linspace(0.01, 100.0, gd.subset_num_nodes['control_input']),
+                  units='deg')
+
+        # The states and time are available even though the sensitivities are not.
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            p.run_model()
+
+        nn = gd.subset_num_nodes['all']
+        assert_near_equal(p.get_val('integrator.time'), 2.0 * np.ones((nn, 1)))
+        assert_near_equal(p.get_val('integrator.states_out:x'), np.zeros((nn, 1)))
+        assert_near_equal(p.get_val('integrator.states_out:y'), 10.0 * np.ones((nn, 1)))
+        assert_near_equal(p.get_val('integrator.states_out:v'), np.ones((nn, 1)))
+
+        with self.assertRaises(om.AnalysisError) as e:
+            p.compute_totals(of=['integrator.states_out:v'], wrt=['integrator.t_duration'])
+
+        self.assertIn('t_duration of zero', str(e.exception))
+
     def test_integrate_with_controls(self):
 
         dymos_options['include_check_partials'] = True
@@ -284,6 +522,58 @@ class TestODEIntegrationComp(unittest.TestCase):
 
         dymos_options['include_check_partials'] = False
 
+    def test_integrate_vector_state(self):
+        dymos_options['include_check_partials'] = True
+
+        gd = GridData(num_segments=2, transcription='gauss-lobatto', transcription_order=3)
+
+        time_options = TimeOptionsDictionary()
+        time_options['units'] = 's'
+
+        state_options = {'x': StateOptionsDictionary()}
+
+        state_options['x']['shape'] = (2,)
+        state_options['x']['units'] = 'm'
+        state_options['x']['rate_source'] = 'x_dot'
+        state_options['x']['targets'] = ['x']
+
+        param_options = {'k': ParameterOptionsDictionary()}
+
+        param_options['k']['shape'] = (1,)
+        param_options['k']['units'] = '1/s**2'
+        param_options['k']['targets'] = ['k']
+
+        p = om.Problem()
+
+        p.model.add_subsystem('integrator',
+                              ODEIntegrationComp(ode_class=OscillatorODE,
+                                                 time_options=time_options,
+                                                 state_options=state_options,
+                                                 parameter_options=param_options,
+                                                 input_grid_data=gd,
+                                                 ode_init_kwargs=None))
+
+        p.setup()
+
+        p.set_val('integrator.states:x', [1.0, 0.0])
+        p.set_val('integrator.t_initial', 0.0)
+        p.set_val('integrator.t_duration', 2.0)
+        p.set_val('integrator.parameters:k', 4.0)
+
+        p.run_model()
+
+        t = p.get_val('integrator.time')
+        x = p.get_val('integrator.states_out:x')
+
+        assert_near_equal(x[:, 0], np.cos(2 * t[:, 0]), tolerance=1.0E-5)
+        assert_near_equal(x[:, 1], -2 * np.sin(2 * t[:, 0]), tolerance=1.0E-5)
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(compact_print=True, method='fd')
+            assert_check_partials(cpd, atol=1.0E-4, rtol=1.0E-4)
+
+        dymos_options['include_check_partials'] = False
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()